@@ -1 +1,2 @@
-from . import init, check, boot, compiler
\ No newline at end of file
+# Command modules are imported on demand by openrgd.main (see CORE_COMMANDS),
+# so importing this package must stay side-effect free.
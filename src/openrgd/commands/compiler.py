@@ -26,6 +26,10 @@ app = typer.Typer(help="Specification compilation and domain bundling tools.")
 # Logical plugin name (used by the plugin registry if needed)
 PLUGIN_NAME = "spec"
 
+# Unified twins and domain bundles can reach several MB: write them through
+# a 1 MB buffer instead of the default 8 KB to cut the number of syscalls.
+WRITE_BUFFER_SIZE = 1 << 20
+
 # Domain weight mapping for deterministic ordering
 DOMAIN_WEIGHTS = {
     "01_": 1,
@@ -45,6 +49,20 @@ def indent_block(text: str, indent_str: str = "      ") -> str:
     )
 
 
+def indented_raw_content(record: dict) -> str:
+    """
+    Return the record's raw JSONC indented for embedding in a Human Twin.
+
+    The result is memoized on the record, so the unified twin and the
+    per-domain bundles built in the same run share a single indent pass.
+    """
+    cached = record.get("_indented_raw")
+    if cached is None:
+        cached = indent_block(record["raw_content"], indent_str="      ")
+        record["_indented_raw"] = cached
+    return cached
+
+
 def detect_domain_from_relpath(rel_path: Path) -> tuple[str, int]:
     """
     Detect the domain name and weight from a relative path, e.g.:
@@ -75,14 +93,16 @@ def scan_spec_records(root_dir: Path, spec_dir: Path):
     """
     log(f"Scanning source: {spec_dir}", "DEBUG")
 
-    records = []
+    # Records are grouped by domain weight while scanning (only a handful of
+    # buckets), so the final ordering is a few small sorts instead of one big one.
+    buckets = {}
     file_list = sorted(spec_dir.rglob("*.jsonc"))
 
     for file_path in smart_track(file_list, "[cyan]Compiling Standard...[/]"):
         if "unified_spec" in file_path.name:
             # Avoid including previously generated unified specs
             continue
-        if state.get("cinematic"):
+        if state.get("cinematic_heavy"):
             time.sleep(0.05)
 
         try:
@@ -94,7 +114,7 @@ def scan_spec_records(root_dir: Path, spec_dir: Path):
             rel_path = file_path.relative_to(root_dir)
             domain, weight = detect_domain_from_relpath(rel_path)
 
-            records.append(
+            buckets.setdefault(weight, []).append(
                 {
                     "path": str(rel_path).replace("\\", "/"),
                     "id": file_path.stem,
@@ -107,8 +127,10 @@ def scan_spec_records(root_dir: Path, spec_dir: Path):
         except Exception as e:
             log(f"Skipping {file_path.name}: {e}", "WARN")
 
-    # Sort by domain weight first, then by id
-    records.sort(key=lambda x: (x["weight"], x["id"]))
+    # Order by domain weight first, then by id
+    records = []
+    for weight in sorted(buckets):
+        records.extend(sorted(buckets[weight], key=lambda x: x["id"]))
     return records
 
 
@@ -174,7 +196,7 @@ def generate_machine_unified_from_records(
 
     out_dir.mkdir(parents=True, exist_ok=True)
     path_j = out_dir / f"{output_base}.json"
-    with open(path_j, "w", encoding="utf-8") as f:
+    with open(path_j, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
         json.dump(machine_doc, f, indent=2)
     log(f"Machine Twin generated: {path_j}", "SUCCESS")
 
@@ -215,7 +237,7 @@ def generate_human_unified_from_records(records, out_dir: Path, output_base: str
         jsonc_lines.append(f'      "id": "{r["id"]}",')
         jsonc_lines.append(f'      "domain": "{r["domain"]}",')
         jsonc_lines.append('      "content": ')
-        indented_raw = indent_block(r["raw_content"], indent_str="      ")
+        indented_raw = indented_raw_content(r)
         jsonc_lines.append(indented_raw)
 
         if i < total - 1:
@@ -228,7 +250,7 @@ def generate_human_unified_from_records(records, out_dir: Path, output_base: str
 
     out_dir.mkdir(parents=True, exist_ok=True)
     path_c = out_dir / f"{output_base}.jsonc"
-    with open(path_c, "w", encoding="utf-8") as f:
+    with open(path_c, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
         f.write("\n".join(jsonc_lines))
     log(f"Human Twin generated: {path_c}", "SUCCESS")
 
@@ -325,7 +347,7 @@ def generate_machine_unified_from_standard(
 
     standard_dir.mkdir(parents=True, exist_ok=True)
     path_j = standard_dir / f"{output_base}.json"
-    with open(path_j, "w", encoding="utf-8") as f:
+    with open(path_j, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
         json.dump(machine_doc, f, indent=2)
     log(f"Machine Twin (from /standard) generated: {path_j}", "SUCCESS")
 
@@ -382,7 +404,7 @@ def generate_domain_bundles(
 
         json_dir.mkdir(parents=True, exist_ok=True)
         path_j = json_dir / f"{base_name}.json"
-        with open(path_j, "w", encoding="utf-8") as f:
+        with open(path_j, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
             json.dump(machine_doc, f, indent=2)
         log(f"[Domain {dom}] Machine bundle generated: {path_j}", "SUCCESS")
 
@@ -410,7 +432,7 @@ def generate_domain_bundles(
             jsonc_lines.append(f'      "id": "{r["id"]}",')
             jsonc_lines.append(f'      "domain": "{r["domain"]}",')
             jsonc_lines.append('      "content": ')
-            indented_raw = indent_block(r["raw_content"], indent_str="      ")
+            indented_raw = indented_raw_content(r)
             jsonc_lines.append(indented_raw)
 
             if i < total - 1:
@@ -423,7 +445,7 @@ def generate_domain_bundles(
 
         jsonc_dir.mkdir(parents=True, exist_ok=True)
         path_c = jsonc_dir / f"{base_name}.jsonc"
-        with open(path_c, "w", encoding="utf-8") as f:
+        with open(path_c, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
             f.write("\n".join(jsonc_lines))
         log(f"[Domain {dom}] Human bundle generated: {path_c}", "SUCCESS")
 
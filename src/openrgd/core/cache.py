@@ -0,0 +1,65 @@
+"""
+OpenRGD Execution Cache.
+
+A small on-disk cache (same idea as Python's __pycache__) for expensive,
+deterministic parses of source files: USD stages, JSONC modules, etc.
+
+There is one entry per (namespace, absolute path), overwritten on a miss, so
+the cache never grows beyond the set of sources actually parsed. Each entry
+stores the source's (mtime, size) and the parser version next to the value:
+any edit to the source file or bump of the parser version invalidates it.
+Values are stored with pickle under ~/.cache/openrgd/.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+CACHE_DIR = Path.home() / ".cache" / "openrgd"
+
+
+def _cache_entry(namespace: str, source: Path, version: str) -> Tuple[Path, tuple]:
+    """Returns (cache file, stamp) for `source`; the stamp validates the entry."""
+    resolved = source.resolve()
+    st = resolved.stat()
+    key = hashlib.blake2b(f"{namespace}|{resolved}".encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{namespace}-{key}.pkl", (st.st_mtime_ns, st.st_size, version)
+
+
+def cached_parse(namespace: str, source: Path, version: str, compute: Callable[[], Any]) -> Any:
+    """
+    Returns the cached result of `compute()` for `source`, computing and
+    storing it on a miss. Empty results (parse failures) are never stored.
+
+    The cache is best-effort: any I/O or unpickling problem simply falls
+    back to running `compute()`.
+    """
+    try:
+        cache_file, stamp = _cache_entry(namespace, Path(source), version)
+    except OSError:
+        return compute()
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_stamp, value = pickle.load(f)
+        if cached_stamp == stamp:
+            return value
+    except Exception:
+        pass
+
+    result = compute()
+    if not result:
+        return result
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except Exception:
+        pass
+
+    return result
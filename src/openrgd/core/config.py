@@ -8,6 +8,7 @@ state = {
     "quiet": False,
     "verbose": False,
     "cinematic": True,
+    "cinematic_heavy": False,
     "delay": 0.5
 }
 
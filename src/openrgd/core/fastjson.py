@@ -0,0 +1,51 @@
+"""
+OpenRGD Fast JSON Helpers.
+
+Thin wrapper around `orjson` (optional, Rust/C accelerated) that falls back
+transparently to the stdlib `json` module when it is not installed.
+
+`dumps_indented` writes 2-space indented JSON with both backends, and both
+agree on the values: non-finite floats (inf/nan) become `null` (stdlib json
+would write the invalid `Infinity`/`NaN`), non-ASCII text is written as
+UTF-8 (not \\u escapes) and non-string keys are converted to strings.
+The only textual difference left is the spelling of some floats
+(orjson `0.000036` vs json `3.6e-05`), which parse to the same value.
+`loads` returns the same dict/list trees as `json.loads`.
+"""
+
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Parses JSON from `bytes` or `str` (bytes skip a decode with orjson)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _finite(obj):
+    """Copy of a JSON tree with non-finite floats replaced by None (orjson semantics)."""
+    if type(obj) is float:
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def dumps_indented(obj) -> str:
+    """Serializes `obj` as 2-space indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    try:
+        return json.dumps(obj, indent=2, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        # inf/nan presenti: normalizzati a null come fa orjson
+        return json.dumps(_finite(obj), indent=2, ensure_ascii=False, allow_nan=False)
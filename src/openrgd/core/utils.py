@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 import typer
 from rich.panel import Panel
@@ -9,8 +10,20 @@ def find_default_kernel() -> Path:
     """
     Looks for the kernel in standard locations relative to CWD or Project Root.
     Target: spec/00_core/kernel.jsonc
+
+    Hits are memoized per process, keyed on the CWD (the result also depends
+    on the filesystem, so a kernel found once is assumed to stay there).
+    Misses are not cached: a kernel created later in the same process
+    (e.g. 'init' then 'check' from tooling) is still found.
     """
-    current_dir = Path.cwd()
+    kernel = _find_default_kernel_cached(str(Path.cwd()))
+    if kernel is None:
+        _find_default_kernel_cached.cache_clear()
+    return kernel
+
+@lru_cache(maxsize=16)
+def _find_default_kernel_cached(cwd_str: str) -> Path:
+    current_dir = Path(cwd_str)
     
     candidates = [
         # 1. Standard Structure (Root/spec/00_core/kernel.jsonc)
@@ -49,5 +49,8 @@ def print_header():
     time.sleep(state["delay"])
 
 def smart_track(sequence, description: str):
+    # The progress bar is the only animation applied to bulk loops.
+    # Per-item pauses inside them are reserved for state["cinematic_heavy"]
+    # (off by default) so cinematic mode never inflates real work.
     if state["quiet"] or not state["cinematic"]: return sequence
     return track(sequence, description=description)
\ No newline at end of file
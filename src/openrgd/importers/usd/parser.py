@@ -1,104 +1,291 @@
 import re
-import json
+import math
+import mmap
+import os
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict, Any
 from ..base import BaseImporter
 from ...core.templates import get_templates
+from ...core.cache import cached_parse
+from ...core.fastjson import dumps_indented
+
+# USD SDK nativo (usd-core / pxr, standard negli ambienti Isaac Sim).
+# Se presente viene usato al posto dello scanner regex: e' molto piu'
+# veloce sugli stage grandi e legge anche i file binari (.usd/.usdc).
+try:
+    from pxr import Usd, UsdPhysics
+    _HAS_PXR = True
+except ImportError:
+    _HAS_PXR = False
+
+# Pattern compilati una sola volta per processo (non ad ogni parse/giunto).
+# Sono pattern bytes: il file viene mappato in memoria (mmap) e scandito
+# senza decodificarlo, si decodificano solo i piccoli gruppi catturati.
+_DEFAULT_PRIM_RE = re.compile(rb'defaultPrim\s*=\s*"([^"]+)"')
+_DEF_RE = re.compile(rb'^[ \t]*def\s', re.MULTILINE)
+_JOINT_RE = re.compile(rb'def\s+Physics(Revolute|Prismatic)Joint\s+"([^"]+)"', re.MULTILINE)
+# Numero float USD (segno, decimali ed esponente opzionali). A differenza
+# del vecchio [-0-9.]+ non e' ambiguo (niente backtracking su code
+# malformate tipo "..." o "1-2") e legge anche la notazione 1e3.
+_FLOAT = rb'(-?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)'
+# Campi estratti da ogni blocco giunto: (nome, attributo USD, default)
+_JOINT_FIELDS = (
+    ("lower", rb'physics:lowerLimit', -3.14),
+    ("upper", rb'physics:upperLimit', 3.14),
+    ("stiffness", rb'drive:angular:physics:stiffness', 0.0),
+    ("damping", rb'drive:angular:physics:damping', 0.0),
+    ("max_force", rb'drive:angular:physics:maxForce', 100.0),
+)
+# Un'unica regex con un gruppo nominato per campo: il blocco viene letto in
+# una sola passata invece di cinque search. Il float e' il gruppo (anonimo)
+# annidato subito dopo quello nominato che ha fatto match (m.lastindex + 1).
+_FIELDS_RE = re.compile(
+    rb'float:(?:' + rb'|'.join(
+        rb'(?P<' + name.encode() + rb'>' + attr + rb'\s*=\s*' + _FLOAT + rb')'
+        for name, attr, _default in _JOINT_FIELDS
+    ) + rb')'
+)
+_FIELD_DEFAULTS = {name: default for name, _attr, default in _JOINT_FIELDS}
+
+# Da incrementare ad ogni modifica dell'estrazione: invalida la cache su disco
+_PARSER_VERSION = "5"
+
+# Byte iniziali ispezionati per riconoscere un USD binario (crate .usdc)
+_SNIFF_BYTES = 4096
+
+# Oltre questa dimensione il file viene scandito riga per riga (un blocco
+# giunto alla volta): la memoria resta O(blocco) invece di O(file).
+# Sotto soglia la scansione whole-file via mmap e' piu' rapida.
+_STREAM_THRESHOLD = 2 * 1024 * 1024
+
+def _joint_entry(j_type: str, lower: float, upper: float,
+                 stiffness: float, damping: float, max_force: float) -> Dict[str, Any]:
+    """Builds the RGD actuation entry for a single USD physics joint."""
+    return {
+        "type": j_type,
+        "limits": {
+            "torque_nm": max_force,
+            "range_rad": [lower, upper]
+        },
+        # Qui salviamo i parametri Isaac originali per il round-trip perfetto
+        "isaac_params": {
+            "stiffness": stiffness,
+            "damping": damping
+        }
+    }
+
+def _parse_joint_block(j_type: str, joint_block: bytes) -> Dict[str, Any]:
+    """Extracts limits and drive parameters from the text of one joint block."""
+    # Limiti, Drive (Stiffness/Damping -> PID) e Max Force in una passata.
+    # Vale la prima occorrenza di ogni campo (float() accetta i bytes)
+    found = {}
+    for m in _FIELDS_RE.finditer(joint_block):
+        if m.lastgroup not in found:
+            found[m.lastgroup] = float(m.group(m.lastindex + 1))
+            if len(found) == len(_JOINT_FIELDS): break
+
+    values = {**_FIELD_DEFAULTS, **found}
+    return _joint_entry(
+        j_type, values["lower"], values["upper"],
+        values["stiffness"], values["damping"], values["max_force"]
+    )
 
 class USDImporter(BaseImporter):
     """
     Ingests USD (Universal Scene Description) files in ASCII format (.usda).
     Extracts PhysicsJoints and Drives to reconstruct the OpenRGD definition.
+    When the USD SDK (pxr) is installed, binary stages are supported too.
     """
-    
+
     def parse(self) -> Dict[str, Any]:
         self.log(f"Parsing USD structure from {self.source}...")
-        
-        try:
-            with open(self.source, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            self.log("❌ Error: Can only parse ASCII USD files (.usda). Convert .usd to .usda first.")
-            return {}
-        except Exception as e:
-            self.log(f"❌ Read Error: {e}")
+
+        backend = "pxr" if _HAS_PXR else "ascii"
+        parsed = cached_parse("usd", self.source, f"{_PARSER_VERSION}-{backend}", self._read_stage)
+        if parsed is None:
             return {}
+        self.robot_name, joints = parsed
+
+        self.log(f"Extracted {len(joints)} physics joints from USD.")
+
+        # 3. Costruzione Struttura RGD
+        rgd_structure = get_templates(self.robot_name)
+
+        desc_content = {
+            "hardware_id": self.robot_name,
+            "source_format": "USD",
+            "notes": "Imported from Isaac Sim context"
+        }
+
+        rgd_structure["spec/01_foundation/description.jsonc"] = \
+            f"/** IMPORTED FROM USD */\n{dumps_indented(desc_content)}"
+
+        rgd_structure["spec/01_foundation/actuation_dynamics.jsonc"] = \
+            f"/** IMPORTED FROM ISAAC PHYSICS */\n{dumps_indented(joints)}"
+
+        return rgd_structure
+
+    def _read_stage(self):
+        """
+        Runs the actual parse of the source file (cached on disk by parse()).
+        Returns (robot_name, joints), or None if the file cannot be read.
+        """
+        joints = None
+        if _HAS_PXR:
+            try:
+                joints = self._extract_joints_pxr()
+            except Exception as e:
+                self.log(f"⚠️ USD SDK could not open the stage ({e}). Falling back to ASCII scan.")
 
+        if joints is None:
+            try:
+                with open(self.source, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size == 0:
+                        joints = {} # mmap non accetta file vuoti
+                    elif size >= _STREAM_THRESHOLD:
+                        head = f.read(_SNIFF_BYTES)
+                        if head.startswith(b"PXR-USDC") or b"\x00" in head:
+                            self.log("❌ Error: Can only parse ASCII USD files (.usda). Convert .usd to .usda first.")
+                            return None
+                        f.seek(0)
+                        joints = self._extract_joints_stream(f)
+                    else:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                            head = content[:_SNIFF_BYTES]
+                            if head.startswith(b"PXR-USDC") or b"\x00" in head:
+                                self.log("❌ Error: Can only parse ASCII USD files (.usda). Convert .usd to .usda first.")
+                                return None
+                            joints = self._extract_joints(content)
+            except Exception as e:
+                self.log(f"❌ Read Error: {e}")
+                return None
+
+        return self.robot_name, joints
+
+    def _extract_joints(self, content) -> Dict[str, Any]:
+        """
+        Regex scan of an ASCII USD buffer (bytes or mmap).
+        Updates robot_name from the defaultPrim and returns the joints map.
+        """
         # 1. Trova il nome del robot (Default Prim)
         # Cerca: defaultPrim = "RobotName"
-        name_match = re.search(r'defaultPrim\s*=\s*"([^"]+)"', content)
+        name_match = _DEFAULT_PRIM_RE.search(content)
         if name_match:
-            self.robot_name = name_match.group(1)
+            self.robot_name = name_match.group(1).decode("utf-8", errors="replace")
 
         # 2. Estrazione Giunti (PhysicsRevoluteJoint / PhysicsPrismaticJoint)
         # Pattern: def PhysicsRevoluteJoint "joint_name"
-        joint_pattern = re.compile(r'def\s+Physics(Revolute|Prismatic)Joint\s+"([^"]+)"', re.MULTILINE)
-        
+        # Offset di tutti i 'def' del file, raccolti in un solo passaggio:
+        # la fine di ogni blocco giunto si trova poi via bisect (O(log N))
+        # invece di riscandire il resto del file per ogni giunto.
+        def_offsets = [m.start() for m in _DEF_RE.finditer(content)]
+
         joints = {}
-        
-        for match in joint_pattern.finditer(content):
-            j_type = match.group(1).lower() # revolute or prismatic
-            j_name = match.group(2)
-            
+        for match in _JOINT_RE.finditer(content):
+            j_type = match.group(1).decode("ascii").lower() # revolute or prismatic
+            j_name = match.group(2).decode("utf-8", errors="replace")
+
             # Cerca il blocco del giunto per trovare i limiti
             # (Questo è un parser semplificato, cerca nelle righe successive)
             block_start = match.end()
-            block_end = content.find("def ", block_start) # Cerca il prossimo def come fine blocco
-            if block_end == -1: block_end = len(content)
-            
-            joint_block = content[block_start:block_end]
-            
-            # Estrazione Limiti
-            lower = -3.14
-            upper = 3.14
-            limit_match = re.search(r'float:physics:lowerLimit\s*=\s*([-0-9.]+)', joint_block)
-            if limit_match: lower = float(limit_match.group(1))
-            
-            limit_match = re.search(r'float:physics:upperLimit\s*=\s*([-0-9.]+)', joint_block)
-            if limit_match: upper = float(limit_match.group(1))
-
-            # Estrazione Drive (Stiffness/Damping -> PID)
-            stiffness = 0.0
-            damping = 0.0
-            drive_stiff = re.search(r'float:drive:angular:physics:stiffness\s*=\s*([-0-9.]+)', joint_block)
-            if drive_stiff: stiffness = float(drive_stiff.group(1))
-            
-            drive_damp = re.search(r'float:drive:angular:physics:damping\s*=\s*([-0-9.]+)', joint_block)
-            if drive_damp: damping = float(drive_damp.group(1))
-            
-            # Estrazione Max Force
-            max_force = 100.0
-            force_match = re.search(r'float:drive:angular:physics:maxForce\s*=\s*([-0-9.]+)', joint_block)
-            if force_match: max_force = float(force_match.group(1))
-
-            joints[j_name] = {
-                "type": j_type,
-                "limits": {
-                    "torque_nm": max_force,
-                    "range_rad": [lower, upper]
-                },
-                # Qui salviamo i parametri Isaac originali per il round-trip perfetto
-                "isaac_params": {
-                    "stiffness": stiffness,
-                    "damping": damping
-                }
-            }
+            idx = bisect_right(def_offsets, block_start) # Il prossimo def chiude il blocco
+            block_end = def_offsets[idx] if idx < len(def_offsets) else len(content)
 
-        self.log(f"Extracted {len(joints)} physics joints from USD.")
+            joints[j_name] = _parse_joint_block(j_type, content[block_start:block_end])
 
-        # 3. Costruzione Struttura RGD
-        rgd_structure = get_templates(self.robot_name)
-        
-        desc_content = {
-            "hardware_id": self.robot_name,
-            "source_format": "USD",
-            "notes": "Imported from Isaac Sim context"
-        }
-        
-        rgd_structure["spec/01_foundation/description.jsonc"] = \
-            f"/** IMPORTED FROM USD */\n{json.dumps(desc_content, indent=2)}"
-            
-        rgd_structure["spec/01_foundation/actuation_dynamics.jsonc"] = \
-            f"/** IMPORTED FROM ISAAC PHYSICS */\n{json.dumps(joints, indent=2)}"
+        return joints
+
+    def _extract_joints_stream(self, f) -> Dict[str, Any]:
+        """
+        Line-by-line variant of _extract_joints for large stages: only the
+        joint blocks currently open are kept in memory. Blocks are delimited
+        exactly as in the whole-file scan (from the joint header to the next
+        line starting with 'def').
+        """
+        joints = {}
+        name_found = False
+        # Blocchi aperti: (tipo, nome, righe). Di norma al massimo uno
+        open_blocks = []
+
+        for line in f:
+            if not name_found:
+                name_match = _DEFAULT_PRIM_RE.search(line)
+                if name_match:
+                    self.robot_name = name_match.group(1).decode("utf-8", errors="replace")
+                    name_found = True
+
+            # Una riga 'def' chiude i blocchi aperti
+            if open_blocks and _DEF_RE.match(line):
+                for j_type, j_name, block_lines in open_blocks:
+                    joints[j_name] = _parse_joint_block(j_type, b"".join(block_lines))
+                open_blocks = []
+
+            for block in open_blocks:
+                block[2].append(line)
+
+            if b"Joint" in line: # Pre-filtro economico prima della regex
+                for match in _JOINT_RE.finditer(line):
+                    j_type = match.group(1).decode("ascii").lower()
+                    j_name = match.group(2).decode("utf-8", errors="replace")
+                    open_blocks.append((j_type, j_name, [line[match.end():]]))
+
+        for j_type, j_name, block_lines in open_blocks:
+            joints[j_name] = _parse_joint_block(j_type, b"".join(block_lines))
+
+        return joints
+
+    def _extract_joints_pxr(self) -> Dict[str, Any]:
+        """
+        Native path: opens the stage with the USD SDK and reads the typed
+        physics attributes of every Revolute/Prismatic joint prim.
+        """
+        stage = Usd.Stage.Open(str(self.source))
+        if stage is None:
+            raise ValueError("Usd.Stage.Open returned no stage")
+
+        default_prim = stage.GetDefaultPrim()
+        if default_prim:
+            self.robot_name = default_prim.GetName()
+
+        joints = {}
+        for prim in stage.Traverse():
+            if prim.IsA(UsdPhysics.RevoluteJoint):
+                j_type = "revolute"
+            elif prim.IsA(UsdPhysics.PrismaticJoint):
+                j_type = "prismatic"
+            else:
+                continue
+
+            # UsdPhysics: limiti dei giunti revolute in gradi, RGD usa radianti
+            angular = j_type == "revolute"
+            joints[prim.GetName()] = _joint_entry(
+                j_type,
+                self._attr_float(prim, "physics:lowerLimit", -3.14, degrees=angular),
+                self._attr_float(prim, "physics:upperLimit", 3.14, degrees=angular),
+                self._attr_float(prim, "drive:angular:physics:stiffness", 0.0),
+                self._attr_float(prim, "drive:angular:physics:damping", 0.0),
+                self._attr_float(prim, "drive:angular:physics:maxForce", 100.0),
+            )
+
+        return joints
 
-        return rgd_structure
\ No newline at end of file
+    @staticmethod
+    def _attr_float(prim, name: str, default: float, degrees: bool = False) -> float:
+        """
+        Reads an authored float attribute from a prim, or returns default.
+        Non-finite values (e.g. +/-inf limits of a continuous joint) also
+        fall back to default. With degrees=True the authored value is
+        converted to radians (the default is already in radians).
+        """
+        attr = prim.GetAttribute(name)
+        if not attr or not attr.HasAuthoredValue():
+            return default
+        value = attr.Get()
+        if value is None:
+            return default
+        value = float(value)
+        if not math.isfinite(value):
+            return default
+        return math.radians(value) if degrees else value
@@ -9,6 +9,7 @@ ARCHITECTURAL OVERVIEW:
 1.  **Framework:** Uses `typer` for robust CLI parsing and help generation.
 2.  **Command Registration:** - Core verbs (init, check, boot...) are registered directly.
     - Sub-systems (like 'run') are registered as sub-apps (`add_typer`) to group functionality.
+    - Command modules are imported lazily: only the requested verb is loaded.
 3.  **Global State:** Handles flags like `--quiet` and `--verbose` via a callback 
     before any command is executed, injecting them into the `core.config.state`.
 4.  **UX Layer:** Manages the "Cinematic" startup sequence via `print_header`. 
@@ -17,32 +18,87 @@ ARCHITECTURAL OVERVIEW:
 
 USAGE:
     This file is exposed as the `rgd` console script via `pyproject.toml`.
-    Execution flow: run() -> _register_commands() -> app()
+    Execution flow: run() -> _enable_bytecode_cache() -> _register_core_commands() -> app()
 --------------------------------------------------------------------------------
 """
 
+import importlib.util
+import os
 import sys
+from pathlib import Path
+
 import typer
 
 # Core Utilities
+from .core.cache import CACHE_DIR
 from .core.config import state
 from .core.visuals import log, print_header
 
 # Command Modules (The Verbs)
-# NOTE: We rename 'run' to 'runtime_cmd' to avoid namespace collision with the run() function below.
-from .commands import (
-    init, 
-    check, 
-    boot, 
-    synapse, #the nerve sense of the system - universal interconnector
-    importer, 
-    dist, 
-    compiler,          # Added compiler explicitly
-    run as runtime_cmd # The 'rgd run' sub-application
-)
+# One tiny loader per verb, called lazily by _register_core_commands(), so
+# invoking one verb only pays for that module's import chain (and not for
+# rclpy, viam, ...). The imports stay literal on purpose: PyInstaller
+# (rgd.spec) discovers the command modules by static analysis.
+def _init():
+    from .commands.init import init
+    return init
+
+def _check():
+    from .commands.check import check
+    return check
+
+def _boot():
+    from .commands.boot import boot
+    return boot
+
+def _alive():
+    from .commands.alive import alive_cmd
+    return alive_cmd
+
+def _export():
+    from .commands.synapse import export
+    return export
+
+def _import():
+    from .commands.importer import import_cmd
+    return import_cmd
+
+def _build_standard():
+    from .commands.dist import build_standard
+    return build_standard
+
+def _compile_spec():
+    from .commands.compiler import compile_spec
+    return compile_spec
+
+def _run_app():
+    from .commands.run import app as run_app
+    return run_app
+
+# Routing table: CLI verb -> loader
+CORE_COMMANDS = {
+    # Lifecycle
+    "init": _init,                          # rgd init
+    "check": _check,                        # rgd check
+    "boot": _boot,                          # rgd boot
+
+    # Alive (high-level bootstrap in RGD)
+    "alive": _alive,                        # rgd alive
+
+    # Interoperability
+    "export": _export,                      # rgd export (the nerve sense of the system - universal interconnector)
+    "import": _import,                      # rgd import (renamed to avoid python keyword)
+
+    # Standardization
+    "build-standard": _build_standard,      # rgd build-standard
+    "compile-spec": _compile_spec,          # rgd compile-spec
+}
 
-# Import alive command explicitly
-from .commands.alive import alive_cmd
+# Sub-Applications: CLI group -> loader of the Typer sub-app
+CORE_GROUPS = {
+    # Runtime Engine (rgd run ros2, rgd run studio...)
+    "run": _run_app,
+}
 
 # Initialize the Typer Application
 app = typer.Typer(
@@ -52,34 +108,37 @@ app = typer.Typer(
 )
 
 
+def _requested_verb():
+    """Returns the first non-option argument (the verb), or None."""
+    for arg in sys.argv[1:]:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
 def _register_core_commands() -> None:
     """
-    Registers all available commands onto the main CLI application.
+    Registers the available commands onto the main CLI application.
     This acts as the routing table for the CLI.
+
+    If a known verb was typed, only that command module is imported.
+    Otherwise (bare 'rgd', '--help', unknown verb, completion) every command
+    is registered so Typer can list them or report the error.
     """
-    
-    # --- LEVEL 1: ATOMIC COMMANDS (Single Verbs) ---
-    
-    # Lifecycle
-    app.command()(init.init)          # rgd init
-    app.command()(check.check)        # rgd check
-    app.command()(boot.boot)          # rgd boot
-    
-    # Alive (high-level bootstrap in RGD)
-    app.command(name="alive")(alive_cmd)        # rgd alive
+    verb = _requested_verb()
+    lazy = verb in CORE_COMMANDS or verb in CORE_GROUPS
 
-    # Interoperability
-    app.command()(synapse.export)            # rgd export
-    app.command(name="import")(importer.import_cmd) # rgd import (renamed to avoid python keyword)
-    
-    # Standardization
-    app.command()(dist.build_standard)      # rgd build-standard
-    app.command()(compiler.compile_spec)    # rgd compile-spec
+    # --- LEVEL 1: ATOMIC COMMANDS (Single Verbs) ---
+    for name, loader in CORE_COMMANDS.items():
+        if lazy and name != verb:
+            continue
+        app.command(name=name)(loader())
 
     # --- LEVEL 2: COMMAND GROUPS (Sub-Applications) ---
-    
-    # Runtime Engine (rgd run ros2, rgd run studio...)
-    app.add_typer(runtime_cmd.app, name="run")
+    for name, loader in CORE_GROUPS.items():
+        if lazy and name != verb:
+            continue
+        app.add_typer(loader(), name=name)
 
 
 @app.callback()
@@ -100,11 +159,41 @@ def main(
         state["delay"] = 0
 
 
+def _enable_bytecode_cache() -> None:
+    """
+    Keeps the .pyc cache warm across invocations on read-only installs.
+
+    If the package directory is not writable and ships no bytecode, Python
+    silently skips writing .pyc files and recompiles every command module on
+    each run. Only in that case redirect it to a per-user prefix
+    (~/.cache/openrgd/pycache). Installs that already ship __pycache__
+    (wheels, distro packages) are left alone: once a prefix is set CPython
+    looks only there, and would ignore the shipped bytecode.
+    An explicit PYTHONPYCACHEPREFIX always wins.
+    """
+    if sys.pycache_prefix is not None:
+        return
+    if os.access(Path(__file__).parent, os.W_OK):
+        return
+    if os.path.exists(importlib.util.cache_from_source(__file__)):
+        return # Bytecode gia' installato accanto ai sorgenti
+
+    prefix = CACHE_DIR / "pycache"
+    try:
+        prefix.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return
+    sys.pycache_prefix = str(prefix)
+
+
 def run() -> None:
     """
     Main Entry Point.
     Executed when the user types `rgd` in the terminal.
     """
+
+    # 0. Bytecode cache: must happen before the command modules are imported
+    _enable_bytecode_cache()
     
     # 1. Bootstrapping: Register all commands
     _register_core_commands()
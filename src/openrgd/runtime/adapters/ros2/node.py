@@ -1,3 +1,6 @@
+from functools import partial
+from types import MappingProxyType
+
 import rclpy
 from rclpy.node import Node
 from rclpy.qos import QoSProfile
@@ -9,13 +12,14 @@ from std_msgs.msg import String, Float32
 
 from ....core.visuals import log
 
-MSG_TYPE_MAP = {
+# Read-only: costruita una volta all'import con le classi gia' importate
+MSG_TYPE_MAP = MappingProxyType({
     "sensor_msgs/Image": Image,
     "sensor_msgs/Imu": Imu,
     "sensor_msgs/JointState": JointState,
     "sensor_msgs/LaserScan": LaserScan,
     "std_msgs/String": String
-}
+})
 
 class ROS2Adapter(Node):
     """
@@ -25,7 +29,6 @@ class ROS2Adapter(Node):
     def __init__(self, engine):
         super().__init__('openrgd_runtime_node')
         self.engine = engine
-        self.subscriptions_list = []
         
         self._configure_perception()
         self._configure_actuation()
@@ -49,21 +52,21 @@ class ROS2Adapter(Node):
                 topic = config.get("stream_uri_str")
                 msg_type_str = config.get("data_type_str")
                 
-                if topic and msg_type_str in MSG_TYPE_MAP:
-                    msg_type = MSG_TYPE_MAP[msg_type_str]
-                    
-                    # Creiamo una callback che sa chi è (Closure)
-                    # Inietta il dato direttamente nel cervello (engine)
-                    def callback(msg, sid=sensor_id):
-                        self.engine.ingest_sense(sid, msg)
+                msg_type = MSG_TYPE_MAP.get(msg_type_str)
+
+                if topic and msg_type is not None:
+                    # Callback legata al sensore via partial (niente closure Python):
+                    # inietta il dato direttamente nel cervello (engine)
+                    callback = partial(self.engine.ingest_sense, sensor_id)
 
-                    sub = self.create_subscription(
+                    # Il Node tiene gia' il riferimento alle subscription
+                    # (self.subscriptions): niente lista parallela.
+                    self.create_subscription(
                         msg_type,
                         topic,
                         callback,
                         10 # QoS Default
                     )
-                    self.subscriptions_list.append(sub)
                     log(f"Connected Eye: {sensor_id} -> {topic}", "DEBUG")
                     count += 1
                 else:
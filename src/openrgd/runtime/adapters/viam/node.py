@@ -19,9 +19,12 @@ USAGE:
 """
 
 import asyncio
+import math
 import os
 import time
-from typing import Dict, Any, Optional
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Any, Awaitable, Callable, List, Optional
 
 # Viam SDK Imports (Must be installed)
 try:
@@ -38,6 +41,44 @@ except ImportError:
 from ....core.visuals import log
 from ..base import BaseAdapter
 
+# Heuristic type matching based on RGD ID conventions: first keyword found
+# in the RGD id wins (dict order = priority). In v1.0 this should use
+# explicit type fields from the spec.
+_VIAM_TYPE_ROUTER = {
+    "camera": Camera.from_robot,
+    "motor": Motor.from_robot,
+    "joint": Motor.from_robot,
+    "base": Base.from_robot,
+    "sensor": Sensor.from_robot,
+}
+
+class _ReadingView(Mapping):
+    """
+    Read-only {field: value} view over one slot of a SoA sample buffer.
+    Published once into the World Model, so each tick only writes floats
+    in place instead of allocating a fresh dict per component.
+    """
+    __slots__ = ("_field", "_buffer", "_index")
+
+    def __init__(self, field: str, buffer: array, index: int):
+        self._field = field
+        self._buffer = buffer
+        self._index = index
+
+    def __getitem__(self, key):
+        if key != self._field:
+            raise KeyError(key)
+        return self._buffer[self._index]
+
+    def __iter__(self):
+        yield self._field
+
+    def __len__(self):
+        return 1
+
+    def __repr__(self):
+        return repr(dict(self))
+
 class ViamAdapter(BaseAdapter):
     """
     The Cloud-Native Connector.
@@ -47,6 +88,13 @@ class ViamAdapter(BaseAdapter):
         super().__init__(engine)
         self.robot: Optional[RobotClient] = None
         self.parts: Dict[str, Any] = {} # Cache of connected Viam components
+
+        # Sense buffers (Structure of Arrays), built once by _map_components:
+        # motor ids, the dispatch table of pre-bound reader coroutines
+        # (part.get_position) and a preallocated float buffer, all parallel.
+        self._motor_ids: List[str] = []
+        self._sense_dispatch: List[Callable[[], Awaitable[float]]] = []
+        self._positions = array('d')
         
         # Connection Configuration (from Env Vars)
         self.address = os.getenv("VIAM_ADDRESS", "localhost:8080")
@@ -94,16 +142,9 @@ class ViamAdapter(BaseAdapter):
             
             try:
                 part = None
-                # Heuristic type matching based on RGD ID conventions
-                # In v1.0 this should use explicit type fields from the spec
-                if "camera" in rgd_id:
-                    part = Camera.from_robot(self.robot, viam_name)
-                elif "motor" in rgd_id or "joint" in rgd_id:
-                    part = Motor.from_robot(self.robot, viam_name)
-                elif "base" in rgd_id:
-                    part = Base.from_robot(self.robot, viam_name)
-                elif "sensor" in rgd_id:
-                    part = Sensor.from_robot(self.robot, viam_name)
+                from_robot = next((fn for kw, fn in _VIAM_TYPE_ROUTER.items() if kw in rgd_id), None)
+                if from_robot:
+                    part = from_robot(self.robot, viam_name)
                 
                 if part:
                     self.parts[rgd_id] = part
@@ -113,8 +154,26 @@ class ViamAdapter(BaseAdapter):
             except Exception:
                 log(f"Component not found on robot: {viam_name}", "WARN")
         
+        self._build_sense_buffers()
         log(f"Mapped {count} hardware components via Viam API.", "SUCCESS")
 
+    def _build_sense_buffers(self):
+        """
+        Partitions the mapped parts into the SoA buffers polled every tick
+        and publishes one live view per motor into the World Model.
+        Cameras are not polled on every tick to save bandwidth.
+        """
+        self._motor_ids = [rgd_id for rgd_id, part in self.parts.items() if isinstance(part, Motor)]
+        self._sense_dispatch = [self.parts[rgd_id].get_position for rgd_id in self._motor_ids]
+        self._positions = array('d', [math.nan]) * len(self._motor_ids) # NaN = no sample yet
+
+        if self.engine.state.get("world_model") is None:
+            self.engine.state["world_model"] = {}
+        world_model = self.engine.state["world_model"]
+
+        for i, rgd_id in enumerate(self._motor_ids):
+            world_model[rgd_id] = _ReadingView("position", self._positions, i)
+
     def spin(self):
         """Main Async Loop Entry Point."""
         loop = asyncio.new_event_loop()
@@ -132,9 +191,10 @@ class ViamAdapter(BaseAdapter):
 
     async def _lifecycle_loop(self):
         """The Cognitive Heartbeat (Target: 10Hz)."""
+        period = 0.1 # 100ms target
+        deadline = time.monotonic()
+
         while True:
-            start_time = asyncio.get_event_loop().time()
-            
             # 1. SENSE PHASE (Parallel Data Gathering)
             await self._sense_phase()
             
@@ -144,38 +204,42 @@ class ViamAdapter(BaseAdapter):
             # 3. ACT PHASE (Parallel Dispatch - Placeholder)
             # await self._act_phase()
             
-            # Frequency Maintenance
-            elapsed = asyncio.get_event_loop().time() - start_time
-            sleep_time = max(0, 0.1 - elapsed) # 100ms target
-            await asyncio.sleep(sleep_time)
+            # Frequency Maintenance: absolute monotonic deadlines, so loop
+            # jitter does not accumulate into drift across ticks.
+            deadline += period
+            now = time.monotonic()
+            if now < deadline:
+                await asyncio.sleep(deadline - now)
+            else:
+                # Overrun: resync to now instead of bursting to catch up
+                deadline = now
+                await asyncio.sleep(0)
 
     async def _sense_phase(self):
         """Pull data from all connected sensors in parallel."""
-        tasks = []
-        ids = []
-        
-        for rgd_id, part in self.parts.items():
-            if isinstance(part, Motor):
-                tasks.append(part.get_position())
-                ids.append((rgd_id, "position"))
-            elif isinstance(part, Camera):
-                # Skip cameras on every tick to save bandwidth
-                pass 
-
-        if not tasks: return
-
-        # Execute all RPC calls concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for (rgd_id, type_), res in zip(ids, results):
+        dispatch = self._sense_dispatch
+        if not dispatch: return
+
+        if len(dispatch) == 1:
+            # Single motor: await directly, gather would only add Future overhead.
+            # Same semantics as return_exceptions=True.
+            try:
+                results = [await dispatch[0]()]
+            except Exception as e:
+                results = [e]
+        else:
+            # Execute all RPC calls concurrently (no type checks on the hot path)
+            results = await asyncio.gather(
+                *[read() for read in dispatch],
+                return_exceptions=True
+            )
+
+        # Write samples in place into the SoA buffer (read via the World Model views)
+        positions = self._positions
+        for i, res in enumerate(results):
             if isinstance(res, Exception):
                 continue
-            
-            # Inject data into the RGD World Model state
-            if self.engine.state.get("world_model") is None:
-                self.engine.state["world_model"] = {}
-                
-            self.engine.state["world_model"][rgd_id] = {type_: res}
+            positions[i] = res
 
     def publish_intent(self, intent):
         """Translates RGD Intent into Viam Commands (TODO)."""
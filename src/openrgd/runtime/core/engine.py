@@ -1,8 +1,22 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 from ...core.utils import load_jsonc
+from ...core.cache import cached_parse
 from ...core.visuals import log
 
+@lru_cache(maxsize=128)
+def _load_jsonc_cached(path_str: str, mtime_ns: int) -> Dict:
+    """
+    In-process cache of the spec modules, keyed on (path, mtime): further
+    engine instances in the same process (tests, tooling) skip the parse.
+    The returned dicts are shared, treat them as read-only.
+    """
+    path = Path(path_str)
+    # Cache su disco keyed su (path, mtime, size): il boot successivo
+    # salta strip_jsonc + json.loads se il modulo non e' cambiato
+    return cached_parse("jsonc", path, "1", lambda: load_jsonc(path))
+
 class RGDEngine:
     """
     The Pure Logic Core.
@@ -28,7 +42,7 @@ class RGDEngine:
         if not path.exists():
             log(f"Missing core module: {rel_path}", "WARN")
             return {}
-        return load_jsonc(path)
+        return _load_jsonc_cached(str(path.resolve()), path.stat().st_mtime_ns)
 
     def process_perception(self, sensor_id: str, data: Any) -> Dict:
         """
@@ -42,6 +56,13 @@ class RGDEngine:
         self.state["world_model"][sensor_id] = data
         return {"status": "UPDATED", "reflex_trigger": False}
 
+    def ingest_sense(self, sensor_id: str, data: Any) -> Dict:
+        """
+        Entry point used by runtime adapters (e.g. ROS2 subscribers)
+        to push raw sensor samples into the engine.
+        """
+        return self.process_perception(sensor_id, data)
+
     def validate_command(self, actuator_id: str, value: float) -> bool:
         """
         Checks if a command violates the safety envelope.
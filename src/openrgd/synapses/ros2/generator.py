@@ -1,12 +1,154 @@
-import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from ..base import BaseSynapse  # Import aggiornato
+from ...core.cache import cached_parse
+from ...core.fastjson import loads
+
+# ijson (opzionale, backend C yajl2) legge il Twin in streaming: vengono
+# materializzati solo i moduli in files[*], uno alla volta, e la lettura si
+# ferma appena trovati quelli necessari. Il backend Python puro e' piu'
+# lento del full-load con orjson, quindi in quel caso non viene usato.
+try:
+    import ijson
+    _HAS_IJSON = ijson.backend != "python"
+except ImportError:
+    _HAS_IJSON = False
+
+# Moduli del Machine Twin letti dalla Synapse ROS2
+_TWIN_MODULES = ("actuation_dynamics", "actuation_topology", "hal_mapping")
+
+# Chiavi di metadati da non trattare come giunti
+_META_KEYS = frozenset(("meta_group", "__doc__"))
+
+# Sotto-dizionari appiattiti da _flatten per _extract_val, in ordine di priorita'.
+# Tupla a livello di modulo: non viene ricostruita ad ogni chiamata
+_SUB_CONTAINERS = ("limits", "application_limits", "joint_limits", "control_defaults", "position_mode_gains")
+
+def _json_clone(o):
+    """
+    Deep copy for pure JSON data: clones dict/list nodes and shares the
+    (immutable) leaf scalars. Much cheaper than copy.deepcopy (no memo,
+    no reflection).
+    """
+    if type(o) is dict: return {k: _json_clone(v) for k, v in o.items()}
+    if type(o) is list: return [_json_clone(x) for x in o]
+    return o
+
+def _merge_into(dest, src):
+    """
+    Merges `src` over `dest` in place. Recurses only where both sides hold
+    a dict; any other value (or a key missing in dest) is assigned as a
+    clone, so `dest` never shares containers with `src` (the cached Twin).
+    """
+    for k, v in src.items():
+        if type(v) is dict and type(dest.get(k)) is dict:
+            _merge_into(dest[k], v)
+        else:
+            dest[k] = _json_clone(v)
+
+def _flatten(data):
+    """
+    One-level flat view of a joint record for _extract_val: top-level keys
+    win over sub-container keys, earlier sub-containers over later ones.
+    """
+    flat = {}
+    for sub in reversed(_SUB_CONTAINERS):
+        s = data.get(sub)
+        if type(s) is dict: flat.update(s)
+    flat.update(data)
+    return flat
+
+def _as_float(value) -> float:
+    """Coerces a spec value to float; missing or non-numeric values count as 0.0."""
+    try:
+        return float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+# Limite di buffer per singola chiamata writev (IOV_MAX, 1024 su Linux)
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0: _IOV_MAX = 1024
+
+_NEWLINE = b"\n"
+
+def _write_lines(path: Path, lines) -> None:
+    """
+    Writes the lines separated by newlines as UTF-8.
+    On POSIX the encoded lines go to the kernel via os.writev (gather
+    write), without building the joined document in Python first.
+    """
+    if not hasattr(os, "writev"): # Windows: join + write in binary mode
+        with open(path, "wb") as f: f.write("\n".join(lines).encode("utf-8"))
+        return
+
+    bufs = []
+    for line in lines:
+        bufs.append(line.encode("utf-8"))
+        bufs.append(_NEWLINE)
+    if bufs: bufs.pop() # Nessun newline dopo l'ultima riga (come il join)
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        for start in range(0, len(bufs), _IOV_MAX):
+            batch = bufs[start:start + _IOV_MAX]
+            written = os.writev(fd, batch)
+            if written < sum(map(len, batch)):
+                # Scrittura parziale (raro su file regolari): completa il resto
+                rest = memoryview(b"".join(batch))[written:]
+                while rest:
+                    rest = rest[os.write(fd, rest):]
+    finally:
+        os.close(fd)
+
+def _select_modules(files):
+    """
+    Returns {id: content} for the _TWIN_MODULES found in the twin's files
+    (first occurrence of each id), stopping as soon as all are found.
+    """
+    modules = {}
+    for m in files:
+        mid = m.get("id")
+        if mid in _TWIN_MODULES and mid not in modules:
+            modules[mid] = m.get("content")
+            if len(modules) == len(_TWIN_MODULES): break
+    return modules
+
+def _load_twin_modules(path: Path):
+    """Loads only the modules the ROS2 synapse needs from the Machine Twin."""
+    if _HAS_IJSON:
+        with open(path, "rb") as f:
+            return _select_modules(ijson.items(f, "files.item", use_float=True))
+    # orjson (se presente) direttamente sui bytes: niente decode + json.load
+    return _select_modules(loads(path.read_bytes()).get("files", ()))
+
+@lru_cache(maxsize=4)
+def _load_twin_cached(path_str: str, mtime_ns: int):
+    """
+    Twin modules cached by (path, mtime): in-process for repeated generate()
+    calls, and on disk (core.cache) for repeated 'rgd' runs on an unchanged
+    Twin. The returned dicts are shared, treat them as read-only.
+    """
+    path = Path(path_str)
+    return cached_parse("twin-ros2", path, "1", lambda: _load_twin_modules(path))
 
 class ROS2Synapse(BaseSynapse):
     """
     Connects OpenRGD to the ROS 2 Ecosystem.
     Generates: ros2_control.yaml, rgd_limits.xacro, rgd_hardware.xacro.
     """
+
+    # I tre generatori girano su thread distinti: i log non devono intrecciarsi
+    _log_lock = threading.Lock()
+
+    def log(self, msg: str):
+        with self._log_lock:
+            super().log(msg)
     
     def generate(self, output_dir: Path) -> None:
         self.log(f"Extending neural pathways to ROS 2 for {self.robot_id}...")
@@ -17,23 +159,16 @@ class ROS2Synapse(BaseSynapse):
             self.log("❌ Machine Twin not found. Run 'rgd compile-spec' first.")
             return
 
+        # 2. EXTRACT (solo i moduli necessari, non l'intero Twin)
         try:
-            with open(unified_path, 'r', encoding='utf-8') as f:
-                unified_data = json.load(f)
+            modules = _load_twin_cached(str(unified_path.resolve()), unified_path.stat().st_mtime_ns)
         except Exception as e:
             self.log(f"❌ Error reading Twin: {e}")
             return
 
-        # 2. EXTRACT
-        actuation_dynamics = None
-        actuation_topology = None
-        hal_mapping = None
-
-        for module in unified_data.get("files", []):
-            mid = module.get("id")
-            if mid == "actuation_dynamics": actuation_dynamics = module.get("content")
-            elif mid == "actuation_topology": actuation_topology = module.get("content")
-            elif mid == "hal_mapping": hal_mapping = module.get("content")
+        actuation_dynamics = modules.get("actuation_dynamics")
+        actuation_topology = modules.get("actuation_topology")
+        hal_mapping = modules.get("hal_mapping")
 
         if not actuation_dynamics:
             self.log("❌ Critical: 'actuation_dynamics' missing.")
@@ -47,31 +182,39 @@ class ROS2Synapse(BaseSynapse):
         topo_data = self._resolve_topology(actuation_topology)
         hal_data = hal_mapping.get("actuator_drivers_map", {}) if hal_mapping else {}
 
-        all_keys = set(list(phys_data.keys()) + list(topo_data.keys()) + list(hal_data.keys()))
+        all_keys = (phys_data.keys() | topo_data.keys() | hal_data.keys()) - _META_KEYS
         
         for key in all_keys:
-            if key in ["meta_group", "__doc__"]: continue
-            
             p = phys_data.get(key, {})
             t = topo_data.get(key, {})
             h = hal_data.get(key, {})
             
             joint_name = t.get("target_joint_ref_str") or p.get("target_joint_ref_str") or h.get("logical_actuator_ref_str") or key
             
-            joints_map[joint_name] = {"physics": p, "topology": t, "hal": h}
+            # Record (physics, topology, hal) di viste flat calcolate una volta sola
+            # per giunto: condivise dai tre generatori, lette via tuple-unpacking
+            joints_map[joint_name] = (_flatten(p), _flatten(t), _flatten(h))
 
         self.log(f"Mapped {len(joints_map)} joints across Physics/Topology/HAL.")
 
+        # Ordine unico e stabile per tutti gli artefatti (diff puliti tra rigenerazioni)
+        ordered = sorted(joints_map)
+
         # 4. GENERATE
-        self._generate_ros2_control_yaml(joints_map, output_dir)
-        self._generate_limits_xacro(joints_map, output_dir)
-        self._generate_hardware_xacro(joints_map, output_dir)
+        # I tre artefatti sono indipendenti: generati e scritti in parallelo
+        # (le write su disco rilasciano il GIL)
+        generators = (self._generate_ros2_control_yaml, self._generate_limits_xacro, self._generate_hardware_xacro)
+        with ThreadPoolExecutor(len(generators)) as ex:
+            futures = [ex.submit(gen, joints_map, ordered, output_dir) for gen in generators]
+            for fut in futures: fut.result() # Propaga eventuali errori
 
     # --- HELPERS (Gli stessi della v0.9 ma indentati nella classe) ---
     def _find_joints_data(self, content):
-        if "joint_dynamics_map" in content: return content["joint_dynamics_map"]
-        if "actuators" in content: return content["actuators"]
-        return {k:v for k,v in content.items() if isinstance(v, dict) and "limits" in v}
+        jd = content.get("joint_dynamics_map")
+        if jd is not None: return jd
+        act = content.get("actuators")
+        if act is not None: return act
+        return {k:v for k,v in content.items() if type(v) is dict and "limits" in v}
 
     def _resolve_topology(self, topo):
         if not topo: return {}
@@ -79,79 +222,76 @@ class ROS2Synapse(BaseSynapse):
         instances = topo.get("joint_actuator_mapping_map", {})
         resolved = {}
         for k, v in instances.items():
-            import copy
-            base = copy.deepcopy(profiles.get(v.get("use_profile_ref_str"), {}))
-            
-            # Recursive update utility
-            def update(d, u):
-                for ki, vi in u.items():
-                    if isinstance(vi, dict): d[ki] = update(d.get(ki, {}), vi)
-                    else: d[ki] = vi
-                return d
-            
-            update(base, v) # Merge instance over profile
+            base = _json_clone(profiles.get(v.get("use_profile_ref_str"), {}))
+            _merge_into(base, v) # Merge instance over profile
             resolved[k] = base
         return resolved
 
-    def _extract_val(self, data, keys, default=None):
+    def _extract_val(self, flat, keys, default=None):
+        """Looks up the first of `keys` in a record flattened by _flatten()."""
         for k in keys:
-            if k in data: return data[k]
-            for sub in ["limits", "application_limits", "joint_limits", "control_defaults", "position_mode_gains"]:
-                if sub in data and k in data[sub]: return data[sub][k]
+            if k in flat: return flat[k]
         return default
 
-    def _generate_ros2_control_yaml(self, joints_map, output_dir):
+    def _generate_ros2_control_yaml(self, joints_map, ordered, output_dir):
         lines = [f"# OPENRGD GENERATED: ROS2 CONTROL", "controller_manager:", "  ros__parameters:", "    update_rate: 100", 
                  "    joint_state_broadcaster:", "      type: joint_state_broadcaster/JointStateBroadcaster",
                  "    forward_position_controller:", "      type: position_controllers/JointGroupPositionController", "",
                  "forward_position_controller:", "  ros__parameters:", "    joints:"]
-        for name in sorted(joints_map.keys()): lines.append(f"      - {name}")
+        lines.extend(f"      - {name}" for name in ordered)
         lines.append("    gains:")
         
-        for name, data in joints_map.items():
-            topo = data["topology"]
-            p = self._extract_val(topo, ["kp_position_float", "kp"], 0.0)
-            i = self._extract_val(topo, ["ki_position_float", "ki"], 0.0)
-            d = self._extract_val(topo, ["kd_position_float", "kd"], 0.0)
-            if p or i or d: lines.append(f"      {name}: {{p: {p}, i: {i}, d: {d}}}")
+        for name in ordered:
+            _, topo, _ = joints_map[name]
+            # Coercizione a float una volta sola: il gate sotto confronta solo double
+            p = _as_float(self._extract_val(topo, ("kp_position_float", "kp")))
+            i = _as_float(self._extract_val(topo, ("ki_position_float", "ki")))
+            d = _as_float(self._extract_val(topo, ("kd_position_float", "kd")))
+            if p != 0.0 or i != 0.0 or d != 0.0: lines.append(f"      {name}: {{p: {p}, i: {i}, d: {d}}}")
             
-        with open(output_dir / "ros2_control.yaml", "w", encoding="utf-8") as f: f.write("\n".join(lines))
+        _write_lines(output_dir / "ros2_control.yaml", lines)
         self.log(f"✅ Config: ros2_control.yaml")
 
-    def _generate_limits_xacro(self, joints_map, output_dir):
+    def _generate_limits_xacro(self, joints_map, ordered, output_dir):
         lines = ['<?xml version="1.0"?>', '<robot xmlns:xacro="http://www.ros.org/wiki/xacro">', '  ', '']
-        for name, data in joints_map.items():
-            phys = data["physics"]
-            topo = data["topology"]
-            eff = self._extract_val(topo, ["torque_limit_peak_nm_float", "effort"]) or self._extract_val(phys, ["max_torque_nm_float", "effort"], 0.0)
-            vel = self._extract_val(topo, ["velocity_limit_rad_s_float", "velocity"]) or self._extract_val(phys, ["max_velocity_rad_s_float", "velocity"], 0.0)
-            lower = self._extract_val(phys, ["soft_min_position_rad_float", "lower"], -3.14)
-            upper = self._extract_val(phys, ["soft_max_position_rad_float", "upper"], 3.14)
+        for name in ordered:
+            phys, topo, _ = joints_map[name]
+            eff = self._extract_val(topo, ("torque_limit_peak_nm_float", "effort")) or self._extract_val(phys, ("max_torque_nm_float", "effort"), 0.0)
+            vel = self._extract_val(topo, ("velocity_limit_rad_s_float", "velocity")) or self._extract_val(phys, ("max_velocity_rad_s_float", "velocity"), 0.0)
+            lower = self._extract_val(phys, ("soft_min_position_rad_float", "lower"), -3.14)
+            upper = self._extract_val(phys, ("soft_max_position_rad_float", "upper"), 3.14)
             
-            lines.append(f'  <xacro:property name="{name}_effort" value="{eff}" />')
-            lines.append(f'  <xacro:property name="{name}_velocity" value="{vel}" />')
-            lines.append(f'  <xacro:property name="{name}_lower" value="{lower}" />')
-            lines.append(f'  <xacro:property name="{name}_upper" value="{upper}" />')
-            lines.append('')
+            # Un solo blocco (una stringa) per giunto; la riga vuota finale separa i giunti
+            lines.append(
+                f'  <xacro:property name="{name}_effort" value="{eff}" />\n'
+                f'  <xacro:property name="{name}_velocity" value="{vel}" />\n'
+                f'  <xacro:property name="{name}_lower" value="{lower}" />\n'
+                f'  <xacro:property name="{name}_upper" value="{upper}" />\n'
+            )
         lines.append('</robot>')
-        with open(output_dir / "rgd_limits.xacro", "w", encoding="utf-8") as f: f.write("\n".join(lines))
+        _write_lines(output_dir / "rgd_limits.xacro", lines)
         self.log(f"✅ Limits: rgd_limits.xacro")
 
-    def _generate_hardware_xacro(self, joints_map, output_dir):
+    def _generate_hardware_xacro(self, joints_map, ordered, output_dir):
         lines = ['<?xml version="1.0"?>', '<robot xmlns:xacro="http://www.ros.org/wiki/xacro">', '  <ros2_control name="OpenRGD" type="system">', '    <hardware>']
-        plugin = "openrgd_ros2/GenericSystem"
-        for d in joints_map.values():
-            if "driver_plugin_str" in d["hal"]: plugin = d["hal"]["driver_plugin_str"]; break
+        # Primo giunto (in ordine) che dichiara un plugin, altrimenti il generico
+        plugin = next(
+            (hal["driver_plugin_str"] for _, _, hal in (joints_map[name] for name in ordered) if "driver_plugin_str" in hal),
+            "openrgd_ros2/GenericSystem"
+        )
         lines.append(f'      <plugin>{plugin}</plugin>'); lines.append('    </hardware>')
         
-        for name, data in joints_map.items():
-            hal = data["hal"]
-            can_id = self._extract_val(hal, ["device_node_id_int", "can_id"], 0)
-            lines.append(f'    <joint name="{name}">')
-            lines.append(f'      <param name="can_id">{can_id}</param>')
-            lines.append('      <state_interface name="position"/>')
-            lines.append('      <command_interface name="position"/>')
-            lines.append('    </joint>')
+        for name in ordered:
+            _, _, hal = joints_map[name]
+            can_id = self._extract_val(hal, ("device_node_id_int", "can_id"), 0)
+            # Un solo blocco (una stringa) per giunto invece di 5 righe separate
+            lines.append(
+                f'    <joint name="{name}">\n'
+                f'      <param name="can_id">{can_id}</param>\n'
+                '      <state_interface name="position"/>\n'
+                '      <command_interface name="position"/>\n'
+                '    </joint>'
+            )
         lines.append('  </ros2_control>'); lines.append('</robot>')
-        with open(output_dir / "rgd_hardware.xacro", "w", encoding="utf-8") as f: f.write("\n".join(lines))
+        _write_lines(output_dir / "rgd_hardware.xacro", lines)
         self.log(f"✅ Drivers: rgd_hardware.xacro")
\ No newline at end of file